@@ -0,0 +1,100 @@
+import numpy as np
+
+from libc.math cimport fabs
+from libc.stdint cimport int64_t, uint8_t
+
+cdef uint8_t VALID = 0
+cdef uint8_t CORRUPTED = 1
+cdef uint8_t INTERPOLATED = 2
+
+
+cdef Py_ssize_t _bisect_left(const double[::1] a, double x, Py_ssize_t n) noexcept nogil:
+    cdef Py_ssize_t lo = 0
+    cdef Py_ssize_t hi = n
+    cdef Py_ssize_t mid
+
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if a[mid] < x:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+cpdef align_numeric(const double[::1] video_ts,
+                    const double[::1] sensor_ts,
+                    const double[::1] sensor_vals,
+                    double max_gap,
+                    bint use_interpolation=True):
+    cdef Py_ssize_t m = video_ts.shape[0]
+    cdef Py_ssize_t n = sensor_ts.shape[0]
+
+    nearest_arr = np.empty(m, dtype=np.int64)
+    sensor_ts_arr = np.empty(m, dtype=np.float64)
+    sensor_vals_arr = np.empty(m, dtype=np.float64)
+    time_diff_arr = np.empty(m, dtype=np.float64)
+    quality_arr = np.empty(m, dtype=np.uint8)
+
+    cdef int64_t[::1] nearest_out = nearest_arr
+    cdef double[::1] sensor_ts_out = sensor_ts_arr
+    cdef double[::1] sensor_vals_out = sensor_vals_arr
+    cdef double[::1] time_diff_out = time_diff_arr
+    cdef uint8_t[::1] quality_out = quality_arr
+
+    cdef Py_ssize_t i, idx, nearest
+    cdef double t, time_diff, ld, rd, t1, t2, v1, v2
+    cdef double sensor_timestamp, sensor_value
+    cdef uint8_t quality
+
+    if n == 0:
+        raise ValueError("Sensor data is empty!")
+
+    with nogil:
+        for i in range(m):
+            t = video_ts[i]
+            idx = _bisect_left(sensor_ts, t, n)
+
+            if idx == 0:
+                nearest = 0
+                time_diff = fabs(t - sensor_ts[0])
+            elif idx == n:
+                nearest = n - 1
+                time_diff = fabs(t - sensor_ts[n - 1])
+            else:
+                ld = fabs(t - sensor_ts[idx - 1])
+                rd = fabs(t - sensor_ts[idx])
+                if ld <= rd:
+                    nearest = idx - 1
+                    time_diff = ld
+                else:
+                    nearest = idx
+                    time_diff = rd
+
+            quality = VALID
+            sensor_timestamp = sensor_ts[nearest]
+            sensor_value = sensor_vals[nearest]
+
+            if time_diff > max_gap:
+                quality = CORRUPTED
+            elif use_interpolation and time_diff > 0 and 0 < nearest < n - 1:
+                t1 = sensor_ts[nearest - 1]
+                t2 = sensor_ts[nearest + 1]
+
+                if t1 <= t <= t2:
+                    if t2 - t1 > max_gap:
+                        quality = CORRUPTED
+                    else:
+                        v1 = sensor_vals[nearest - 1]
+                        v2 = sensor_vals[nearest + 1]
+                        sensor_value = v1 + (v2 - v1) * ((t - t1) / (t2 - t1))
+                        sensor_timestamp = t
+                        quality = INTERPOLATED
+
+            nearest_out[i] = nearest
+            sensor_ts_out[i] = sensor_timestamp
+            sensor_vals_out[i] = sensor_value
+            time_diff_out[i] = time_diff
+            quality_out[i] = quality
+
+    return nearest_arr, sensor_ts_arr, sensor_vals_arr, time_diff_arr, quality_arr
@@ -1,23 +1,55 @@
 import bisect
+import sys
+from array import array
+from operator import attrgetter
 from typing import List, Dict, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
+try:
+    import numba
+    from numba import prange
+except ImportError:
+    numba = None
+    prange = range
+
+try:
+    from _align_core import align_numeric as _align_numeric_cython
+except ImportError:
+    _align_numeric_cython = None
+
 class DataQuality(Enum):
     VALID = "valid"  
     CORRUPTED = "corrupted"  
     INTERPOLATED = "interpolated"  
 
-@dataclass
+_VALID, _CORRUPTED, _INTERPOLATED = 0, 1, 2
+_QUALITY_ENUM = (DataQuality.VALID, DataQuality.CORRUPTED, DataQuality.INTERPOLATED)
+
+_ALIGNED_DTYPE = np.dtype([
+    ('video_ts', 'f8'),
+    ('sensor_ts', 'f8'),
+    ('sensor_val', 'f8'),
+    ('time_diff', 'f8'),
+    ('quality', 'u1'),
+    ('interp', '?')
+])
+
+_get_timestamp = attrgetter('timestamp')
+_get_value = attrgetter('value')
+
+@dataclass(slots=True)
 class DataPoint:
     timestamp: float  
     value: Any  
     source: str  
 
-    def __repr__(self):
+    def __str__(self):
         return f"DataPoint(t={self.timestamp}ms, value={self.value}, source={self.source})"
 
-@dataclass
+@dataclass(slots=True)
 class AlignedPair:
     video_timestamp: float
     video_value: Any
@@ -33,13 +65,102 @@ class AlignedPair:
                 f"diff={self.time_difference:.2f}ms, "
                 f"quality={self.quality.value})")
 
+def _align_numeric_kernel(video_ts: np.ndarray,
+                          sensor_ts: np.ndarray,
+                          sensor_vals: np.ndarray,
+                          max_gap: float,
+                          use_interpolation: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    m = video_ts.shape[0]
+    n = sensor_ts.shape[0]
+
+    nearest_out = np.empty(m, dtype=np.int64)
+    sensor_ts_out = np.empty(m, dtype=np.float64)
+    sensor_vals_out = np.empty(m, dtype=np.float64)
+    time_diff_out = np.empty(m, dtype=np.float64)
+    quality_out = np.empty(m, dtype=np.uint8)
+
+    for i in prange(m):
+        t = video_ts[i]
+
+        lo = 0
+        hi = n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if sensor_ts[mid] < t:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo == 0:
+            nearest = 0
+            time_diff = abs(t - sensor_ts[0])
+        elif lo == n:
+            nearest = n - 1
+            time_diff = abs(t - sensor_ts[n - 1])
+        else:
+            left_diff = abs(t - sensor_ts[lo - 1])
+            right_diff = abs(t - sensor_ts[lo])
+            if left_diff <= right_diff:
+                nearest = lo - 1
+                time_diff = left_diff
+            else:
+                nearest = lo
+                time_diff = right_diff
+
+        quality = _VALID
+        sensor_timestamp = sensor_ts[nearest]
+        sensor_value = sensor_vals[nearest]
+
+        if time_diff > max_gap:
+            quality = _CORRUPTED
+        elif use_interpolation and time_diff > 0 and 0 < nearest < n - 1:
+            t1 = sensor_ts[nearest - 1]
+            t2 = sensor_ts[nearest + 1]
+
+            if t1 <= t <= t2:
+                if t2 - t1 > max_gap:
+                    quality = _CORRUPTED
+                else:
+                    v1 = sensor_vals[nearest - 1]
+                    v2 = sensor_vals[nearest + 1]
+                    sensor_value = v1 + (v2 - v1) * ((t - t1) / (t2 - t1))
+                    sensor_timestamp = t
+                    quality = _INTERPOLATED
+
+        nearest_out[i] = nearest
+        sensor_ts_out[i] = sensor_timestamp
+        sensor_vals_out[i] = sensor_value
+        time_diff_out[i] = time_diff
+        quality_out[i] = quality
+
+    return nearest_out, sensor_ts_out, sensor_vals_out, time_diff_out, quality_out
+
+_align_numeric_njit = numba.njit(parallel=True, cache=True)(_align_numeric_kernel) if numba is not None else None
+
+def _is_sorted_by_timestamp(points: List[DataPoint]) -> bool:
+    it = iter(points)
+    prev = next(it, None)
+    for point in it:
+        if point.timestamp < prev.timestamp:
+            return False
+        prev = point
+    return True
+
 class TemporalAligner:
 
     def __init__(self, 
                  sensor_data: List[DataPoint],
                  max_gap_threshold: float = 50.0):
-        self.sensor_data = sorted(sensor_data, key=lambda x: x.timestamp)
-        self.sensor_timestamps = [d.timestamp for d in self.sensor_data]
+        self.sensor_data = list(sensor_data)
+        if not _is_sorted_by_timestamp(self.sensor_data):
+            self.sensor_data.sort(key=_get_timestamp)
+        self.sensor_timestamps = array('d', map(_get_timestamp, self.sensor_data))
+        self._vals = list(map(_get_value, self.sensor_data))
+        self._ts = np.frombuffer(self.sensor_timestamps, dtype=np.float64)
+        self._neighbor_gap = np.full(len(self._ts), np.inf)
+        self._neighbor_gap[1:-1] = self._ts[2:] - self._ts[:-2]
+        self.numeric_values = all(isinstance(v, (int, float)) for v in self._vals)
+        self._vals_numeric = np.asarray(self._vals, dtype=np.float64) if self.numeric_values else None
         self.max_gap_threshold = max_gap_threshold
 
         self.stats = {
@@ -53,33 +174,50 @@ class TemporalAligner:
         if not self.sensor_timestamps:
             raise ValueError("Sensor data is empty!")
 
-        idx = bisect.bisect_left(self.sensor_timestamps, target_timestamp)
-
-        candidates = []
+        # Scalar lookups bisect the packed array directly: a single np.searchsorted call costs
+        # more in dispatch overhead than bisect spends on the whole search. Batches use self._ts.
+        sensor_timestamps = self.sensor_timestamps
+        n = len(sensor_timestamps)
+        idx = bisect.bisect_left(sensor_timestamps, target_timestamp)
+
+        if idx == 0:
+            return 0, sensor_timestamps[0] - target_timestamp
+        if idx == n:
+            return n - 1, target_timestamp - sensor_timestamps[n - 1]
+
+        left_diff = target_timestamp - sensor_timestamps[idx - 1]
+        right_diff = sensor_timestamps[idx] - target_timestamp
+        if left_diff <= right_diff:
+            return idx - 1, left_diff
+        return idx, right_diff
+
+    def find_nearest_neighbors_batch(self, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        sensor_ts = self._ts
+        n = len(sensor_ts)
+        if n == 0:
+            raise ValueError("Sensor data is empty!")
 
-        if idx > 0:
-            left_idx = idx - 1
-            left_diff = abs(target_timestamp - self.sensor_timestamps[left_idx])
-            candidates.append((left_idx, left_diff))
+        targets = np.asarray(targets, dtype=np.float64)
+        idx = np.searchsorted(sensor_ts, targets, side='left')
 
-        if idx < len(self.sensor_timestamps):
-            right_idx = idx
-            right_diff = abs(target_timestamp - self.sensor_timestamps[right_idx])
-            candidates.append((right_idx, right_diff))
+        left = np.clip(idx - 1, 0, n - 1)
+        right = np.clip(idx, 0, n - 1)
+        left_diff = np.abs(targets - sensor_ts[left])
+        right_diff = np.abs(targets - sensor_ts[right])
 
-        best_idx, best_diff = min(candidates, key=lambda x: x[1])
+        pick_left = left_diff <= right_diff
+        best_idx = np.where(pick_left, left, right)
+        best_diff = np.where(pick_left, left_diff, right_diff)
         return best_idx, best_diff
 
     def interpolate(self, 
                     timestamp: float,
                     before_idx: int,
                     after_idx: int) -> Any:
-        before = self.sensor_data[before_idx]
-        after = self.sensor_data[after_idx]
+        t1, v1 = self.sensor_timestamps[before_idx], self._vals[before_idx]
+        t2, v2 = self.sensor_timestamps[after_idx], self._vals[after_idx]
 
-        if isinstance(before.value, (int, float)) and isinstance(after.value, (int, float)):
-            t1, v1 = before.timestamp, before.value
-            t2, v2 = after.timestamp, after.value
+        if isinstance(v1, (int, float)) and isinstance(v2, (int, float)):
 
             if t2 == t1:
                 return v1
@@ -89,83 +227,230 @@ class TemporalAligner:
             return interpolated
         else:
 
-            if abs(timestamp - before.timestamp) < abs(timestamp - after.timestamp):
-                return before.value
+            if abs(timestamp - t1) < abs(timestamp - t2):
+                return v1
             else:
-                return after.value
+                return v2
+
+    def align_arrays(self,
+                     video_ts: np.ndarray,
+                     use_interpolation: bool = True) -> Dict[str, np.ndarray]:
+        if not self.numeric_values:
+            raise TypeError("align_arrays requires numeric sensor values!")
+        if len(self._ts) == 0:
+            raise ValueError("Sensor data is empty!")
 
-    def align(self, 
-              video_data: List[DataPoint],
-              use_interpolation: bool = True) -> List[AlignedPair]:
-        aligned_pairs = []
+        video_ts = np.ascontiguousarray(video_ts, dtype=np.float64)
 
-        for video_point in video_data:
+        if _align_numeric_njit is not None:
+            nearest_idx, sensor_timestamp, sensor_value, time_diff, quality = _align_numeric_njit(
+                video_ts, self._ts, self._vals_numeric,
+                float(self.max_gap_threshold), bool(use_interpolation))
+        elif _align_numeric_cython is not None:
+            nearest_idx, sensor_timestamp, sensor_value, time_diff, quality = _align_numeric_cython(
+                video_ts, self._ts, self._vals_numeric,
+                float(self.max_gap_threshold), bool(use_interpolation))
+        else:
+            nearest_idx, sensor_timestamp, sensor_value, time_diff, quality = self._align_numeric_numpy(
+                video_ts, use_interpolation)
 
-            nearest_idx, time_diff = self.find_nearest_neighbor(video_point.timestamp)
-            nearest_sensor = self.sensor_data[nearest_idx]
+        self._record_stats(np.bincount(quality, minlength=3).tolist())
 
-            quality = DataQuality.VALID
-            interpolation_used = False
-            sensor_timestamp = nearest_sensor.timestamp
-            sensor_value = nearest_sensor.value
+        return {
+            'nearest_idx': nearest_idx,
+            'sensor_timestamp': sensor_timestamp,
+            'sensor_value': sensor_value,
+            'time_difference': time_diff,
+            'quality': quality,
+            'interpolation_used': quality == _INTERPOLATED
+        }
 
-            if time_diff > self.max_gap_threshold:
-                quality = DataQuality.CORRUPTED
-                self.stats['corrupted_alignments'] += 1
-            else:
+    def _align_numeric_numpy(self,
+                             video_ts: np.ndarray,
+                             use_interpolation: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        sensor_ts = self._ts
+        n = len(sensor_ts)
+        max_gap = self.max_gap_threshold
+
+        nearest_idx, time_diff = self.find_nearest_neighbors_batch(video_ts)
+        sensor_timestamp = sensor_ts[nearest_idx]
+        sensor_value = self._vals_numeric[nearest_idx]
+
+        corrupted = time_diff > max_gap
+        interpolated = np.zeros(len(video_ts), dtype=bool)
+
+        if use_interpolation:
+            before_idx = np.clip(nearest_idx - 1, 0, n - 1)
+            after_idx = np.clip(nearest_idx + 1, 0, n - 1)
+            before_ts = sensor_ts[before_idx]
+            after_ts = sensor_ts[after_idx]
+
+            has_both = (nearest_idx > 0) & (nearest_idx < n - 1)
+            in_between = (before_ts <= video_ts) & (video_ts <= after_ts)
+            candidates = ~corrupted & (time_diff > 0) & has_both & in_between
+            neighbor_gap = self._neighbor_gap[nearest_idx]
+            gap_ok = neighbor_gap <= max_gap
+
+            interpolated = candidates & gap_ok
+            corrupted |= candidates & ~gap_ok
+
+            t = video_ts[interpolated]
+            t1 = before_ts[interpolated]
+            v1 = self._vals_numeric[before_idx[interpolated]]
+            v2 = self._vals_numeric[after_idx[interpolated]]
+            sensor_value[interpolated] = v1 + (v2 - v1) * ((t - t1) / neighbor_gap[interpolated])
+            sensor_timestamp[interpolated] = t
+
+        quality = np.full(len(video_ts), _VALID, dtype=np.uint8)
+        quality[corrupted] = _CORRUPTED
+        quality[interpolated] = _INTERPOLATED
+
+        return nearest_idx, sensor_timestamp, sensor_value, time_diff, quality
+
+    def align_structured(self,
+                         video_data: List[DataPoint],
+                         use_interpolation: bool = True) -> np.ndarray:
+        video_ts = np.fromiter(map(_get_timestamp, video_data), dtype=np.float64, count=len(video_data))
+        result = self.align_arrays(video_ts, use_interpolation)
+
+        out = np.empty(len(video_ts), dtype=_ALIGNED_DTYPE)
+        out['video_ts'] = video_ts
+        out['sensor_ts'] = result['sensor_timestamp']
+        out['sensor_val'] = result['sensor_value']
+        out['time_diff'] = result['time_difference']
+        out['quality'] = result['quality']
+        out['interp'] = result['interpolation_used']
+        return out
 
-                if use_interpolation and time_diff > 0:
+    def align(self, 
+              video_data: List[DataPoint],
+              use_interpolation: bool = True) -> List[AlignedPair]:
+        if not video_data:
+            return []
+        if not self.numeric_values:
+            if use_interpolation:
+                return self._align_with_interp(video_data)
+            return self._align_no_interp(video_data)
+
+        video_ts = np.fromiter(map(_get_timestamp, video_data), dtype=np.float64, count=len(video_data))
+        result = self.align_arrays(video_ts, use_interpolation)
+
+        sensor_values = self._vals
+        return [
+            AlignedPair(
+                video_timestamp=video_point.timestamp,
+                video_value=video_point.value,
+                sensor_timestamp=sensor_timestamp,
+                sensor_value=sensor_value if interpolation_used else sensor_values[nearest_idx],
+                time_difference=time_diff,
+                quality=_QUALITY_ENUM[quality],
+                interpolation_used=interpolation_used
+            )
+            for video_point, nearest_idx, sensor_timestamp, sensor_value, time_diff, quality, interpolation_used
+            in zip(video_data,
+                   result['nearest_idx'].tolist(),
+                   result['sensor_timestamp'].tolist(),
+                   result['sensor_value'].tolist(),
+                   result['time_difference'].tolist(),
+                   result['quality'].tolist(),
+                   result['interpolation_used'].tolist())
+        ]
+
+    def _align_no_interp(self, video_data: List[DataPoint]) -> List[AlignedPair]:
+        video_ts = np.fromiter(map(_get_timestamp, video_data), dtype=np.float64, count=len(video_data))
+        nearest_indices, time_diffs = self.find_nearest_neighbors_batch(video_ts)
+
+        sensor_timestamps = self.sensor_timestamps
+        sensor_values = self._vals
+        max_gap = self.max_gap_threshold
+        valid_quality = DataQuality.VALID
+        corrupted_quality = DataQuality.CORRUPTED
+
+        aligned_pairs = [
+            AlignedPair(
+                video_timestamp=video_point.timestamp,
+                video_value=video_point.value,
+                sensor_timestamp=sensor_timestamps[nearest_idx],
+                sensor_value=sensor_values[nearest_idx],
+                time_difference=time_diff,
+                quality=corrupted_quality if time_diff > max_gap else valid_quality,
+                interpolation_used=False
+            )
+            for video_point, nearest_idx, time_diff
+            in zip(video_data, nearest_indices.tolist(), time_diffs.tolist())
+        ]
 
-                    before_idx = nearest_idx - 1 if nearest_idx > 0 else None
-                    after_idx = nearest_idx + 1 if nearest_idx < len(self.sensor_data) - 1 else None
+        corrupted_count = int(np.count_nonzero(time_diffs > max_gap))
+        self._record_stats([len(video_data) - corrupted_count, corrupted_count, 0])
+        return aligned_pairs
 
-                    if before_idx is not None and after_idx is not None:
-                        before = self.sensor_data[before_idx]
-                        after = self.sensor_data[after_idx]
+    def _align_with_interp(self, video_data: List[DataPoint]) -> List[AlignedPair]:
+        aligned_pairs = [None] * len(video_data)
 
-                        if before.timestamp <= video_point.timestamp <= after.timestamp:
+        video_ts = np.fromiter(map(_get_timestamp, video_data), dtype=np.float64, count=len(video_data))
+        nearest_indices, time_diffs = self.find_nearest_neighbors_batch(video_ts)
 
-                            gap_between_sensors = after.timestamp - before.timestamp
+        sensor_timestamps = self.sensor_timestamps
+        sensor_values = self._vals
+        max_gap = self.max_gap_threshold
+        last_idx = len(sensor_timestamps) - 1
+        quality_enum = _QUALITY_ENUM
+        counts = [0, 0, 0]
 
-                            if gap_between_sensors > self.max_gap_threshold:
+        for i, (video_point, nearest_idx, time_diff) in enumerate(
+                zip(video_data, nearest_indices.tolist(), time_diffs.tolist())):
 
-                                quality = DataQuality.CORRUPTED
-                                self.stats['corrupted_alignments'] += 1
+            video_timestamp = video_point.timestamp
+            quality = _VALID
+            sensor_timestamp = sensor_timestamps[nearest_idx]
+            sensor_value = sensor_values[nearest_idx]
 
-                                sensor_timestamp = nearest_sensor.timestamp
-                                sensor_value = nearest_sensor.value
-                            else:
+            if time_diff > max_gap:
+                quality = _CORRUPTED
+            elif time_diff > 0 and 0 < nearest_idx < last_idx:
+                before_ts = sensor_timestamps[nearest_idx - 1]
+                after_ts = sensor_timestamps[nearest_idx + 1]
 
-                                sensor_value = self.interpolate(video_point.timestamp, before_idx, after_idx)
-                                sensor_timestamp = video_point.timestamp  
-                                quality = DataQuality.INTERPOLATED
-                                interpolation_used = True
-                                self.stats['interpolated_alignments'] += 1
-                        else:
+                if before_ts <= video_timestamp <= after_ts:
+                    gap_between_sensors = after_ts - before_ts
 
-                            self.stats['valid_alignments'] += 1
+                    if gap_between_sensors > max_gap:
+                        quality = _CORRUPTED
                     else:
+                        before_value = sensor_values[nearest_idx - 1]
+                        after_value = sensor_values[nearest_idx + 1]
+
+                        if isinstance(before_value, (int, float)) and isinstance(after_value, (int, float)):
+                            ratio = (video_timestamp - before_ts) / gap_between_sensors
+                            sensor_value = before_value + (after_value - before_value) * ratio
+                        elif abs(video_timestamp - before_ts) < abs(video_timestamp - after_ts):
+                            sensor_value = before_value
+                        else:
+                            sensor_value = after_value
+                        sensor_timestamp = video_timestamp  
+                        quality = _INTERPOLATED
 
-                        self.stats['valid_alignments'] += 1
-                else:
-
-                    self.stats['valid_alignments'] += 1
-
-            pair = AlignedPair(
-                video_timestamp=video_point.timestamp,
+            counts[quality] += 1
+            aligned_pairs[i] = AlignedPair(
+                video_timestamp=video_timestamp,
                 video_value=video_point.value,
                 sensor_timestamp=sensor_timestamp,
                 sensor_value=sensor_value,
                 time_difference=time_diff,
-                quality=quality,
-                interpolation_used=interpolation_used
+                quality=quality_enum[quality],
+                interpolation_used=quality == _INTERPOLATED
             )
 
-            aligned_pairs.append(pair)
-            self.stats['total_alignments'] += 1
-
+        self._record_stats(counts)
         return aligned_pairs
 
+    def _record_stats(self, counts: List[int]) -> None:
+        stats = self.stats
+        stats['total_alignments'] += sum(counts)
+        stats['valid_alignments'] += counts[_VALID]
+        stats['corrupted_alignments'] += counts[_CORRUPTED]
+        stats['interpolated_alignments'] += counts[_INTERPOLATED]
+
     def get_statistics(self) -> Dict[str, Any]:
         total = max(1, self.stats['total_alignments'])  
         return {
@@ -178,35 +463,30 @@ class TemporalAligner:
         }
 
 def generate_sample_data() -> Tuple[List[DataPoint], List[DataPoint]]:
-    video_data = []
-    sensor_data = []
+    video_count = 10
+    sensor_count = 30
 
     video_start = 100.0
     video_interval = 1000.0 / 30.0  
+    video_ts = video_start + np.arange(video_count) * video_interval
 
-    for i in range(10):  
-        timestamp = video_start + i * video_interval
-        video_data.append(DataPoint(
-            timestamp=timestamp,
-            value=f"kamera_karesi_{i+1}",
-            source="video"
-        ))
+    video_data = [
+        DataPoint(timestamp=timestamp, value=f"kamera_karesi_{i+1}", source="video")
+        for i, timestamp in enumerate(video_ts.tolist())
+    ]
 
     sensor_start = 105.0  
     sensor_interval = 1000.0 / 100.0  
+    sensor_idx = np.arange(sensor_count)
+    sensor_ts = sensor_start + sensor_idx * sensor_interval
+    speeds = 5.0 + (sensor_idx % 5) * 0.5  
 
-    for i in range(30):  
-        timestamp = sensor_start + i * sensor_interval
-
-        speed = 5.0 + (i % 5) * 0.5  
-
-        sensor_data.append(DataPoint(
-            timestamp=timestamp,
-            value=speed,
-            source="sensor"
-        ))
+    keep = ~((200 <= sensor_ts) & (sensor_ts <= 250))
 
-    sensor_data = [d for d in sensor_data if not (200 <= d.timestamp <= 250)]
+    sensor_data = [
+        DataPoint(timestamp=timestamp, value=speed, source="sensor")
+        for timestamp, speed in zip(sensor_ts[keep].tolist(), speeds[keep].tolist())
+    ]
 
     return video_data, sensor_data
 
@@ -229,30 +509,34 @@ def print_alignment_results(aligned_pairs: List[AlignedPair], stats: Dict[str, A
           f"{'Diff (ms)':<12} {'Quality':<15} {'Interp':<8}")
     print("-" * 100)
 
+    quality_icons = {
+        DataQuality.VALID: "✅",
+        DataQuality.CORRUPTED: "⚠️",
+        DataQuality.INTERPOLATED: "🔗"
+    }
+
+    lines = []
     for pair in aligned_pairs:
-        quality_icon = {
-            DataQuality.VALID: "✅",
-            DataQuality.CORRUPTED: "⚠️",
-            DataQuality.INTERPOLATED: "🔗"
-        }.get(pair.quality, "❓")
+        quality_icon = quality_icons.get(pair.quality, "❓")
 
         interp_icon = "✓" if pair.interpolation_used else "-"
 
         sensor_val_str = f"{pair.sensor_value:.2f}" if isinstance(pair.sensor_value, (int, float)) else str(pair.sensor_value)
 
-        print(f"{pair.video_timestamp:<12.2f} {str(pair.video_value):<20} "
-              f"{pair.sensor_timestamp:<12.2f} {sensor_val_str:<15} "
-              f"{pair.time_difference:<12.2f} {quality_icon} {pair.quality.value:<12} {interp_icon:<8}")
-
-    print("-" * 100)
+        lines.append(f"{pair.video_timestamp:<12.2f} {str(pair.video_value):<20} "
+                     f"{pair.sensor_timestamp:<12.2f} {sensor_val_str:<15} "
+                     f"{pair.time_difference:<12.2f} {quality_icon} {pair.quality.value:<12} {interp_icon:<8}")
+    lines.append("-" * 100)
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    corrupted = [p for p in aligned_pairs if p.quality == DataQuality.CORRUPTED]
+    corrupted = [p for p in aligned_pairs if p.quality is DataQuality.CORRUPTED]
     if corrupted:
-        print(f"\n⚠️  CORRUPTED DATA DETECTED ({len(corrupted)} entries):")
+        lines = [f"\n⚠️  CORRUPTED DATA DETECTED ({len(corrupted)} entries):"]
         for pair in corrupted:
-            print(f"  • Video: {pair.video_timestamp:.2f}ms - "
-                  f"Nearest sensor: {pair.sensor_timestamp:.2f}ms "
-                  f"(Diff: {pair.time_difference:.2f}ms > {stats['max_gap_threshold']}ms)")
+            lines.append(f"  • Video: {pair.video_timestamp:.2f}ms - "
+                         f"Nearest sensor: {pair.sensor_timestamp:.2f}ms "
+                         f"(Diff: {pair.time_difference:.2f}ms > {stats['max_gap_threshold']}ms)")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     print("=" * 100)
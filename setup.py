@@ -0,0 +1,15 @@
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="temporal-aligner",
+    ext_modules=cythonize(
+        "_align_core.pyx",
+        language_level=3,
+        compiler_directives={
+            'boundscheck': False,
+            'wraparound': False,
+            'cdivision': True
+        }
+    )
+)